@@ -11,6 +11,15 @@ from dataverse_api.errors import DataverseAPIError
 from dataverse_api.utils.batching import APICommand, BatchCommand, RequestMethod, chunk_data
 from dataverse_api.utils.data import serialize_json
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "Content-Type": "application/json; charset=utf-8",
+    "OData-Version": "4.0",
+    "OData-MaxVersion": "4.0",
+}
+
 
 class Dataverse:
     """
@@ -47,7 +56,8 @@ class Dataverse:
         method : str
             Request method.
         url : str
-            URL added to endpoint.
+            Path relative to the endpoint, or an absolute URL
+            (e.g. `@odata.nextLink`) which is used as-is.
         headers : dict
             Optional request headers. Will replace defaults.
         data : dict
@@ -67,18 +77,15 @@ class Dataverse:
         requests.HTTPError
             For failing requests.
         """
-        request_url = urljoin(self._endpoint, url)
-
-        default_headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json; charset=utf-8",
-            "OData-Version": "4.0",
-            "OData-MaxVersion": "4.0",
-        }
+        # Relative paths are appended to the endpoint directly, absolute
+        # URLs (e.g. `@odata.nextLink` when paging) are used as-is.
+        if url.startswith(("http://", "https://")):
+            request_url = url
+        else:
+            request_url = self._endpoint + url
 
-        if headers:
-            for k, v in headers.items():
-                default_headers[k] = v
+        # `requests` merges headers into a new dict, so the defaults are never mutated
+        request_headers = {**DEFAULT_HEADERS, **headers} if headers else DEFAULT_HEADERS
 
         if timeout is None:
             timeout = 120
@@ -89,7 +96,7 @@ class Dataverse:
         resp = self._session.request(
             method=method,
             url=request_url,
-            headers=default_headers,
+            headers=request_headers,
             params=params,
             data=data,
             timeout=timeout,
@@ -178,7 +185,7 @@ class Dataverse:
             try:
                 out.append(self._api_call(**call.__dict__, timeout=timeout))
             except DataverseAPIError as e:
-                logging.error(f"API request error: {e.args[0]}")
+                logger.error("API request error: %s", e.args[0])
                 out.append(e.response)
         return out
 
@@ -215,7 +222,7 @@ class Dataverse:
                 try:
                     resp.append(future.result())
                 except DataverseAPIError as e:
-                    logging.error(f"API request error: {e.args[0]}")
+                    logger.error("API request error: %s", e.args[0])
                     resp.append(e.response)
 
         return resp
@@ -1,6 +1,5 @@
 import logging
 from collections.abc import Collection, Iterable, Mapping, MutableMapping, Sequence
-from copy import copy
 from typing import Any, Literal, overload
 
 import pandas as pd
@@ -27,6 +26,8 @@ from dataverse_api.utils.data import (
     extract_single_valued_relationships,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class DataverseEntity(Dataverse):
     def __init__(
@@ -90,7 +91,7 @@ class DataverseEntity(Dataverse):
             A dataclass with the three relevant attributes.
         """
         columns = ["EntitySetName", "PrimaryIdAttribute", "PrimaryImageAttribute"]
-        logging.debug("Retrieving EntityDefinitions for %s", self.logical_name)
+        logger.debug("Retrieving EntityDefinitions for %s", self.logical_name)
         resp = self._api_call(
             method=RequestMethod.GET,
             url=f"EntityDefinitions(LogicalName='{self.logical_name}')",
@@ -106,7 +107,7 @@ class DataverseEntity(Dataverse):
         Fetch the alternate keys (if any) for the Entity.
         """
         columns = ["SchemaName", "KeyAttributes"]
-        logging.debug("Retrieving alternate keys for %s", self.logical_name)
+        logger.debug("Retrieving alternate keys for %s", self.logical_name)
         resp = self._api_call(
             method=RequestMethod.GET,
             url=f"EntityDefinitions(LogicalName='{self.logical_name}')/Keys",
@@ -131,7 +132,7 @@ class DataverseEntity(Dataverse):
             f"""({' or '.join(f"{msg_col} eq '{x}'" for x in actions)}) and {col} eq '{self.logical_name}'"""
         )
 
-        logging.debug("Retrieving SDK messages for %s", self.logical_name)
+        logger.debug("Retrieving SDK messages for %s", self.logical_name)
         resp = self._api_call(
             method=RequestMethod.GET,
             url="sdkmessagefilters",
@@ -292,7 +293,7 @@ class DataverseEntity(Dataverse):
         url = self.entity_set_name
 
         # Looping through pages
-        logging.debug("Fetching data for read operation on %s.", self.logical_name)
+        logger.debug("Fetching data for read operation on %s.", self.logical_name)
         response = self._api_call(
             method=RequestMethod.GET,
             url=url,
@@ -305,13 +306,13 @@ class DataverseEntity(Dataverse):
             output.append(response)
 
         if return_responses:
-            logging.debug("Fetched all data for read operation, %d responses.", len(output))
+            logger.debug("Fetched all data for read operation, %d responses.", len(output))
             return output
         else:
             data_output: list[dict[str, Any]] = []
             for resp in output:
                 data_output.extend(resp.json()["value"])
-            logging.debug("Fetched all data for read operation, %d elements.", len(data_output))
+            logger.debug("Fetched all data for read operation, %d elements.", len(data_output))
             return data_output
 
     @overload
@@ -377,17 +378,17 @@ class DataverseEntity(Dataverse):
 
         length = len(data)
         if mode == "individual":
-            logging.debug("%d rows to insert using individual inserts.", length)
+            logger.debug("%d rows to insert using individual inserts.", length)
             return self.__create_singles(headers=headers, data=data, threading=threading)
 
         if mode == "multiple":
             if not self.supports_create_multiple:
                 raise DataverseError(f"CreateMultiple is not supported by {self.logical_name}. Use a different mode.")
-            logging.debug("%d rows to insert using CreateMultiple.", length)
+            logger.debug("%d rows to insert using CreateMultiple.", length)
             return self.__create_multiple(headers=headers, data=data, threading=threading)
 
         if mode == "batch":
-            logging.debug(
+            logger.debug(
                 "%d rows to insert using batch insertion.",
                 length,
             )
@@ -424,12 +425,9 @@ class DataverseEntity(Dataverse):
         """
         Insert rows by using the `CreateMultiple` Web API Action.
         """
-        # Preserving input data
-        data = copy(data)
-
-        # Adding odata type to each record
-        for row in data:
-            row["@odata.type"] = BASE_TYPE + self.logical_name
+        # Adding odata type to a copy of each record, preserving input data
+        odata_type = BASE_TYPE + self.logical_name
+        data = [{**row, "@odata.type": odata_type} for row in data]
 
         # Chunking the payload to suggested size
         calls = [
@@ -534,13 +532,13 @@ class DataverseEntity(Dataverse):
             ids = {row[self.primary_id_attr] for row in records}
 
         length = len(ids)
-        logging.info("%d rows to delete.", length)
+        logger.info("%d rows to delete.", length)
         if mode == "individual":
-            logging.debug("%d rows to delete using individual deletes.", length)
+            logger.debug("%d rows to delete using individual deletes.", length)
             return self.__delete_singles(data=ids, threading=threading)
 
         if mode == "batch":
-            logging.debug("%d rows to delete using batch deletes.", length)
+            logger.debug("%d rows to delete using batch deletes.", length)
             batch_data = transform_to_batch_for_delete(url=self.entity_set_name, data=ids)
             return self._batch_api_call(batch_data, batch_size=batch_size or 100, timeout=120, threading=threading)
 
@@ -621,13 +619,13 @@ class DataverseEntity(Dataverse):
         length = len(ids) * len(columns)  # Total number of deletion requests
         output: list[requests.Response] = []
         if mode == "individual":
-            logging.debug("%d properties to delete. Using individual deletes.", length)
+            logger.debug("%d properties to delete. Using individual deletes.", length)
             for col in columns:
                 output.extend(self.__delete_column_singles(data=ids, column=col, threading=threading))
             return output
 
         if mode == "batch":
-            logging.debug("%d properties to delete. Using batch deletes.", length)
+            logger.debug("%d properties to delete. Using batch deletes.", length)
             for col in columns:
                 batch_data = transform_to_batch_for_delete(url=self.entity_set_name, data=ids, column=col)
                 output.extend(self._batch_api_call(batch_data, threading=threading))
@@ -689,11 +687,11 @@ class DataverseEntity(Dataverse):
             data = convert_dataframe_to_dict(data)
 
         if mode == "individual":
-            logging.debug("%d rows to upsert. Using individual upserts.", len(data))
+            logger.debug("%d rows to upsert. Using individual upserts.", len(data))
             return self.__upsert_singles(data=data, keys=key_columns, is_primary_id=is_primary_id, threading=threading)
 
         if mode == "batch":
-            logging.debug("%d rows to upsert. Using batch upserts.", len(data))
+            logger.debug("%d rows to upsert. Using batch upserts.", len(data))
             batch_data = transform_to_batch_for_upsert(
                 url=self.entity_set_name,
                 data=data,
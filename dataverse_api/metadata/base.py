@@ -43,6 +43,20 @@ class MetadataBase(BaseModel):
         converted = convert_dict_keys_to_snake(arg)
         return cls.model_validate(converted)
 
+    def _set_odata_type(self, odata_type: str) -> None:
+        """
+        Sets the `odata_type` extra without revalidating the model,
+        as assigning it would under `validate_assignment`.
+
+        Parameters
+        ----------
+        odata_type : str
+            The full OData type of the Metadata object.
+        """
+        assert self.__pydantic_extra__ is not None
+        self.__pydantic_extra__["odata_type"] = odata_type
+        self.__pydantic_fields_set__.add("odata_type")
+
     def dump_to_dataverse(self, dropna: bool = True) -> dict[str, Any]:
         """
         When called, dumps the vars dictionary as TitleCase,
@@ -15,6 +15,10 @@ from dataverse_api.metadata.enums import (
     CascadeType,
 )
 
+# Labels are by far the most numerous metadata objects, so their types are built once
+_LOCALIZED_LABEL_TYPE = BASE_TYPE + "LocalizedLabel"
+_LABEL_TYPE = BASE_TYPE + "Label"
+
 
 class RequiredLevel(MetadataBase):
     """
@@ -57,7 +61,7 @@ class LocalizedLabel(MetadataBase):
     is_managed: bool = False
 
     def model_post_init(self, _: Any) -> None:
-        self.odata_type: str = BASE_TYPE + "LocalizedLabel"
+        self._set_odata_type(_LOCALIZED_LABEL_TYPE)
 
 
 class Label(MetadataBase):
@@ -74,7 +78,7 @@ class Label(MetadataBase):
     localized_labels: Sequence[LocalizedLabel] = Field(default_factory=list)
 
     def model_post_init(self, _: Any) -> None:
-        self.odata_type: str = BASE_TYPE + "Label"
+        self._set_odata_type(_LABEL_TYPE)
 
 
 @overload
@@ -1,7 +1,6 @@
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from enum import StrEnum
-from textwrap import dedent
 from typing import Any, Collection, Generator, Mapping, MutableMapping, TypeVar
 from urllib.parse import urljoin
 
@@ -19,6 +18,11 @@ class RequestMethod(StrEnum):
     DELETE = "DELETE"
 
 
+# Content-Type line of a batch command, created entities are marked as entries
+_CONTENT_TYPES = {method: "Content-Type: application/json" for method in RequestMethod}
+_CONTENT_TYPES[RequestMethod.POST] = "Content-Type: application/json; type=entry"
+
+
 @dataclass
 class APICommand:
     """
@@ -72,11 +76,9 @@ class BatchCommand:
             self.url += f"/{col}"
             self.data = {"value": value}
 
-        if self.method == RequestMethod.POST:
-            self.content_type += "; type=entry"
+        self.content_type = _CONTENT_TYPES.get(self.method, self.content_type)
 
         if self.headers:
-            print("Extra!")
             self.extra_header = "\n".join([f"{k}: {v}" for k, v in self.headers.items()])
 
         self.url = encode_altkeys(self.url)
@@ -100,17 +102,17 @@ class BatchCommand:
 
         url = urljoin(api_url, self.url)
 
-        row_command = f"""\
-        --{batch_id}
-        Content-Type: application/http
-        Content-Transfer-Encoding: binary
-
-        {self.method} {url} HTTP/1.1
-        {self.content_type}
-        {self.extra_header}\n
-        {serialize_json(self.data)}
-        """
-        return dedent(row_command)
+        return (
+            f"--{batch_id}\n"
+            "Content-Type: application/http\n"
+            "Content-Transfer-Encoding: binary\n"
+            "\n"
+            f"{self.method} {url} HTTP/1.1\n"
+            f"{self.content_type}\n"
+            f"{self.extra_header}\n"
+            "\n"
+            f"{serialize_json(self.data)}\n"
+        )
 
 
 def chunk_data(data: Sequence[T], size: int = 500) -> Generator[Sequence[T], None, None]:
@@ -189,16 +191,28 @@ def transform_upsert_data(
         [0] : The target row identifier
         [1] : The data payload
     """
+    # Materialized once, keeping key order for the identifier and a set for filtering the payload
+    key_parts = tuple(keys)
+
+    if len(key_parts) == 1:
+        # A single key (always the case for primary IDs) needs no list building or joining
+        (key,) = key_parts
+        for row in data:
+            row_key = f"{row[key]}" if is_primary_id else f"{key}={row[key]!r}"
+            yield row_key, {k: v for k, v in row.items() if k != key}
+        return
+
+    key_set = frozenset(key_parts)
     for row in data:
         if is_primary_id:
             # No repr on string
-            row_key = [f"{row[part]}" for part in keys]
+            parts = [f"{row[part]}" for part in key_parts]
         else:
             # Repr on string
-            row_key = [f"{part}={row[part].__repr__()}" for part in keys]
-        row_data = {k: v for k, v in row.items() if k not in keys}
+            parts = [f"{part}={row[part]!r}" for part in key_parts]
+        row_data = {k: v for k, v in row.items() if k not in key_set}
 
-        yield ",".join(row_key), row_data
+        yield ",".join(parts), row_data
 
 
 def transform_to_batch_for_upsert(
@@ -21,10 +21,14 @@ def coerce_timestamps(obj: object) -> str:
     raise TypeError("Type %s not serializable" % type(obj))
 
 
+# `json.dumps` builds a new encoder on every call when given `default`, so one is shared
+_encoder = json.JSONEncoder(default=coerce_timestamps)
+
+
 def serialize_json(obj: Mapping[str, Any] | None) -> str:
     if obj is None:
         return ""
-    return json.dumps(obj, default=coerce_timestamps)
+    return _encoder.encode(obj)
 
 
 def extract_collection_valued_relationships(data: Collection[dict[str, Any]], entity_logical_name: str) -> list[str]:
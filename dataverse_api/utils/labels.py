@@ -17,6 +17,8 @@ def define_label(label: str | Label | None = None, override: str = "", *, langua
         If a `Label` class is passed, it will be returned unprocessed.
     override : str
         Optional argument if no `label` is given. Defaults to an empty string.
+    language_code : int
+        Optional language code ID for a `label` given as a string.
 
     Returns
     -------
@@ -25,11 +27,12 @@ def define_label(label: str | Label | None = None, override: str = "", *, langua
     """
     if isinstance(label, Label):
         return label
-    if isinstance(label, str) and language_code is None:
-        return create_label(label=label)
-    if isinstance(label, str) and isinstance(language_code, int):
-        return create_label(label=label, language_code=language_code)
     if label is None:
         return create_label(label=override)
+    if isinstance(label, str):
+        if language_code is None:
+            return create_label(label=label)
+        if isinstance(language_code, int):
+            return create_label(label=label, language_code=language_code)
 
     raise TypeError("Wrong type supplied!")
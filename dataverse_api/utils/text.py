@@ -1,10 +1,18 @@
 import re
 from functools import lru_cache
 from typing import Any
-from urllib.parse import quote
 
+# Percent-encoding per byte, matching `urllib.parse.quote` with its default `safe="/"`
+_SAFE_BYTES = frozenset(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~/")
+_QUOTED_BYTES = tuple(chr(b) if b in _SAFE_BYTES else f"%{b:02X}" for b in range(256))
 
-@lru_cache
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+_ALTKEY_VALUE = re.compile(r"'([^']*)'")
+# Values made up of safe characters only are left as they are, see `_quote_value`
+_SAFE_VALUE = re.compile(f"[{re.escape(bytes(sorted(_SAFE_BYTES)).decode())}]*")
+
+
+@lru_cache(maxsize=4096)
 def snake_to_title(snek: str) -> str:
     """
     Convert a string from snake_case to TitleCase.
@@ -18,7 +26,7 @@ def snake_to_title(snek: str) -> str:
     return "".join([x.title() for x in components])
 
 
-@lru_cache
+@lru_cache(maxsize=4096)
 def title_to_snake(title: str) -> str:
     """
     Convert a string from snake_case to TitleCase.
@@ -28,7 +36,7 @@ def title_to_snake(title: str) -> str:
     title : str
         TitleCase string for conversion to snake_case
     """
-    return re.sub(r"(?<!^)(?=[A-Z])", "_", title).lower()
+    return _CAMEL_BOUNDARY.sub("_", title).lower()
 
 
 def convert_dict_keys_to_snake(arg: dict[str, Any]) -> dict[str, Any]:
@@ -40,16 +48,24 @@ def convert_dict_keys_to_snake(arg: dict[str, Any]) -> dict[str, Any]:
     arg : dict
     """
     out: dict[str, Any] = dict()
-    for k, v in arg.items():
-        key = title_to_snake(k)
-        if k == "@odata.type":
-            out["odata_type"] = v  # Corresponding value is always a string
-        elif isinstance(v, dict):
-            out[key] = convert_dict_keys_to_snake(v)  # type: ignore
-        elif isinstance(v, list):
-            out[key] = [convert_dict_keys_to_snake(e) for e in v]  # type: ignore
-        else:
-            out[key] = v
+
+    # Nested dicts are filled in from an explicit stack rather than by recursion
+    stack: list[tuple[dict[str, Any], dict[str, Any]]] = [(arg, out)]
+    while stack:
+        src, dst = stack.pop()
+        for k, v in src.items():
+            if k == "@odata.type":
+                dst["odata_type"] = v  # Corresponding value is always a string
+            elif isinstance(v, dict):
+                child: dict[str, Any] = dict()
+                dst[title_to_snake(k)] = child
+                stack.append((v, child))
+            elif isinstance(v, list):
+                children: list[dict[str, Any]] = [dict() for _ in v]
+                dst[title_to_snake(k)] = children
+                stack.extend(zip(v, children))
+            else:
+                dst[title_to_snake(k)] = v
     return out
 
 
@@ -63,19 +79,49 @@ def convert_dict_keys_to_title(arg: dict[str, Any]) -> dict[str, Any]:
     arg : dict
     """
     out: dict[str, Any] = dict()
-    for k, v in arg.items():
-        if k == "odata_type":
-            out["@odata.type"] = v  # Corresponding value is always a string
-        elif k[0] == "@":
-            out[k] = v
-        elif isinstance(v, list):
-            out[snake_to_title(k)] = [convert_dict_keys_to_title(d) for d in v]  # type: ignore
-        elif isinstance(v, dict):
-            out[snake_to_title(k)] = convert_dict_keys_to_title(v)  # type: ignore
-        else:
-            out[snake_to_title(k)] = v
 
-    return dict(sorted(out.items()))  # Needs sort to ensure @odata tag first!
+    # Nested dicts are filled in from an explicit stack rather than by recursion
+    stack: list[tuple[dict[str, Any], dict[str, Any]]] = [(arg, out)]
+    while stack:
+        src, dst = stack.pop()
+        converted: dict[str, Any] = dict()
+        for k, v in src.items():
+            if k == "odata_type":
+                converted["@odata.type"] = v  # Corresponding value is always a string
+            elif k[0] == "@":
+                converted[k] = v
+            elif isinstance(v, list):
+                children: list[dict[str, Any]] = [dict() for _ in v]
+                converted[snake_to_title(k)] = children
+                stack.extend(zip(v, children))
+            elif isinstance(v, dict):
+                child: dict[str, Any] = dict()
+                converted[snake_to_title(k)] = child
+                stack.append((v, child))
+            else:
+                converted[snake_to_title(k)] = v
+
+        dst.update(sorted(converted.items()))  # Needs sort to ensure @odata tag first!
+
+    return out
+
+
+def _quote_value(value: str) -> str:
+    """
+    Percent-encode an altkey value using the precomputed byte table.
+
+    Parameters
+    ----------
+    value : str
+        The altkey value to encode.
+    """
+    if _SAFE_VALUE.fullmatch(value):
+        return value  # Nothing to encode, e.g. plain ASCII codes and numbers
+    return "".join([_QUOTED_BYTES[b] for b in value.encode("utf-8")])
+
+
+def _quote_match(part: re.Match[str]) -> str:
+    return "'" + _quote_value(part.group(1)) + "'"
 
 
 def encode_altkeys(url: str) -> str:
@@ -92,9 +138,6 @@ def encode_altkeys(url: str) -> str:
     str
         The encoded URL.
     """
-
-    def parse(part: re.Match) -> str:  # type: ignore
-        return "'" + quote(part.group(1)) + "'"  # type: ignore
-
-    pat = re.compile(r"\'([^\']*)\'")
-    return re.sub(pat, parse, url)  # type: ignore
+    if "'" not in url:
+        return url  # No quoted altkey values, e.g. primary ID or numeric keys
+    return _ALTKEY_VALUE.sub(_quote_match, url)
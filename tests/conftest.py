@@ -3,42 +3,48 @@ from typing import Any
 import pytest
 import requests
 import responses
+from responses.registries import OrderedRegistry
 
 from dataverse_api.dataverse import DataverseClient
 from dataverse_api.metadata.attributes import LookupAttributeMetadata, StringAttributeMetadata
 from dataverse_api.metadata.complex_properties import Label, LocalizedLabel
-from dataverse_api.metadata.entity import define_entity
+from dataverse_api.metadata.entity import EntityMetadata, define_entity
 from dataverse_api.metadata.relationships import OneToManyRelationshipMetadata
 from dataverse_api.utils.labels import define_label
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def label_string() -> str:
+    return "Test"
+
+
+@pytest.fixture(scope="session")
 def localized_label():
     return LocalizedLabel(label="Test", language_code=69)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def label(localized_label):
     label2 = LocalizedLabel(label="Other Label", language_code=420)
     return Label(localized_labels=[localized_label, label2])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def description_label() -> Label:
     return Label(localized_labels=[LocalizedLabel(label="Description")])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def display_name_label() -> Label:
     return Label(localized_labels=[LocalizedLabel(label="Display Name")])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def schema_name() -> str:
     return "TestSchema"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_entity(schema_name: str):
     return define_entity(
         schema_name=schema_name,
@@ -56,19 +62,25 @@ def sample_entity(schema_name: str):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_entity_payload(sample_entity: EntityMetadata) -> dict[str, Any]:
+    return sample_entity.dump_to_dataverse()
+
+
+@pytest.fixture(scope="session")
 def session() -> requests.Session:
     s = requests.Session()
     return s
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def endpoint() -> str:
     return "http://fun.com"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(session, endpoint):
+    # The client holds no per-test state, so one instance serves the whole session
     return DataverseClient(session=session, environment_url=endpoint)
 
 
@@ -79,6 +91,13 @@ def mocked_responses():
 
 
 @pytest.fixture
+def ordered_responses():
+    # Registrations are consumed in order, so they must be added in request order
+    with responses.RequestsMock(registry=OrderedRegistry) as rsps:
+        yield rsps
+
+
+@pytest.fixture(scope="session")
 def lookup(display_name_label, description_label) -> LookupAttributeMetadata:
     return LookupAttributeMetadata(
         schema_name="Lookup",
@@ -87,7 +106,7 @@ def lookup(display_name_label, description_label) -> LookupAttributeMetadata:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def one_many_relationship(schema_name, description_label, display_name_label, lookup) -> OneToManyRelationshipMetadata:
     return OneToManyRelationshipMetadata(
         schema_name=schema_name,
@@ -100,7 +119,7 @@ def one_many_relationship(schema_name, description_label, display_name_label, lo
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_entity_definition(schema_name: str) -> dict[str, Any]:
     return {
         "@odata.type": "Microsoft.CRM.EntityMetadata",
@@ -26,7 +26,7 @@ def test_base():
     a = inst.dump_to_dataverse()
 
     # Check camel-casing and special case @odata.type
-    assert all([i in a.keys() for i in ["MyStr", "MyInt", "@odata.type", "Bar"]])
+    assert {"MyStr", "MyInt", "@odata.type", "Bar"} <= a.keys()
 
     # Check values
     test_int, test_str, test_type == a["MyStr"], a["MyInt"], a["@odata.type"]
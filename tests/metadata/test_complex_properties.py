@@ -12,22 +12,12 @@ from dataverse_api.metadata.complex_properties import (
 )
 
 
-@pytest.fixture
-def label_string() -> str:
-    return "Test"
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def lang_code() -> int:
     return 69
 
 
-@pytest.fixture
-def localized_label(label_string: str) -> LocalizedLabel:
-    return LocalizedLabel(label=label_string, language_code=123)
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def single_label(localized_label: LocalizedLabel) -> Label:
     return Label(localized_labels=[localized_label])
 
@@ -66,7 +56,7 @@ def test_cascade_config():
     assert len(a) - 2 == sum(1 for i in a.values() if i == "Cascade")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def required_level() -> RequiredLevel:
     return RequiredLevel()
 
@@ -1,71 +1,155 @@
 import json
+import logging
 import re
 from typing import Any
 
 import pytest
 import responses
+from pytest_mock import MockerFixture
 from responses.matchers import header_matcher, json_params_matcher
 
+from dataverse_api._api import DEFAULT_HEADERS
 from dataverse_api.dataverse import DataverseClient
 from dataverse_api.errors import DataverseAPIError
 from dataverse_api.metadata.entity import EntityMetadata
 from dataverse_api.metadata.enums import OwnershipType
 from dataverse_api.metadata.helpers import Publisher, Solution
 from dataverse_api.metadata.relationships import OneToManyRelationshipMetadata
-from dataverse_api.utils.batching import BatchCommand, RequestMethod
+from dataverse_api.utils.batching import APICommand, BatchCommand, RequestMethod
 
 
+_UUID4_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}")
+_BOUNDARY_RE = re.compile(r'multipart/mixed; boundary="batch_(?P<id>.+)"')
+
+
+def _batch_patterns(batch_id: str, endpoint: str) -> tuple[re.Pattern[str], re.Pattern[str]]:
+    # Patterns for a single batch command and the closing batch boundary
+    item = re.compile(
+        rf"--batch_{batch_id}\nContent-Type: application/http\nContent.Transfer.Encoding: binary\n\n"
+        + rf"(?:PUT|GET|DELETE|POST|PATCH) {endpoint}.+ (?:HTTP\/1.1)"
+        + "\nContent-Type: application/json(?:; type=entry)?\n\n",
+        re.M,
+    )
+    terminator = re.compile(rf"--batch_{batch_id}--$", re.M)
+    return item, terminator
+
+
+@pytest.mark.parametrize("method", list(RequestMethod))
 def test_api_call(
     client: DataverseClient,
     mocked_responses: responses.RequestsMock,
-    caplog: pytest.LogCaptureFixture,
+    method: RequestMethod,
 ):
     # Mocking an errored request
+    mocked_responses.add(
+        method=method, url=f"{client._endpoint}Foo", status=500, json={"error": {"message": "Whoopsie!"}}
+    )
+
+    with pytest.raises(DataverseAPIError, match=rf"{method} request failed: Whoopsie!"):
+        client._api_call(method=method, url="Foo")
+
 
+def test_api_call_headers(client: DataverseClient, mocked_responses: responses.RequestsMock):
+    url = f"{client._endpoint}Foo"
+    mocked_responses.get(url=url, match=[header_matcher(DEFAULT_HEADERS)])
+    mocked_responses.get(url=url, match=[header_matcher({**DEFAULT_HEADERS, "Accept": "text/plain", "Foo": "Bar"})])
+
+    client._api_call(method=RequestMethod.GET, url="Foo")
+    client._api_call(method=RequestMethod.GET, url="Foo", headers={"Accept": "text/plain", "Foo": "Bar"})
+
+    assert DEFAULT_HEADERS["Accept"] == "application/json", "Defaults must not be mutated by overrides"
+
+
+def test_individual_call_logs_errors(
+    client: DataverseClient,
+    mocked_responses: responses.RequestsMock,
+    caplog: pytest.LogCaptureFixture,
+):
     mocked_responses.get(url=f"{client._endpoint}Foo", status=500, json={"error": {"message": "Whoopsie!"}})
 
-    with pytest.raises(DataverseAPIError, match=r".*request failed.*"):
-        client._api_call(method=RequestMethod.GET, url="Foo")
+    resp = client._individual_call([APICommand(method=RequestMethod.GET, url="Foo")])
 
+    # Failed calls are logged and their response is returned in place
+    assert resp[0].status_code == 500
+    assert caplog.record_tuples == [
+        ("dataverse_api._api", logging.ERROR, "API request error: GET request failed: Whoopsie!")
+    ]
 
-def test_api_batch(client: DataverseClient, mocked_responses: responses.RequestsMock):
-    batch = "funky"
-    batch_data = [
+
+@pytest.fixture(scope="session")
+def batch_commands() -> tuple[BatchCommand, ...]:
+    return (
         BatchCommand(url="foo", method=RequestMethod.GET),
         BatchCommand(url="bar", method=RequestMethod.PUT, data={"foo": "bar"}),
         BatchCommand(url="moo", method=RequestMethod.POST, data={"foo": "bar"}),
-    ]
+    )
+
+
+def test_api_batch(
+    client: DataverseClient,
+    mocked_responses: responses.RequestsMock,
+    batch_commands: tuple[BatchCommand, ...],
+):
+    batch = "funky"
 
     mocked_responses.post(
         url=f"{client._endpoint}$batch",
         match=[header_matcher({"Content-Type": f'multipart/mixed; boundary="batch_{batch}"', "If-None-Match": "null"})],
     )
 
-    req = client._batch_api_call(batch_data, id_generator=lambda: batch)[0].request.body
+    req = client._batch_api_call(batch_commands, id_generator=lambda: batch)[0].request.body
 
     # Each batch command should be constructed like this:
-    full_pattern = (
-        rf"--batch_{batch}\nContent-Type: application/http\nContent.Transfer.Encoding: binary\n\n"
-        + rf"(?:PUT|GET|DELETE|POST|PATCH) {client._endpoint}.+ (?:HTTP\/1.1)"
-        + "\nContent-Type: application/json(?:; type=entry)?\n\n"
-    )
-    pat = re.compile(full_pattern, re.M)
-    assert len(re.findall(pat, req)) == len(batch_data)
-    assert len(re.findall(rf"--batch_{batch}--$", req, re.M)) == 1, "Should have only one end of batch line."
+    batch_item_re, batch_terminator_re = _batch_patterns(batch, client._endpoint)
+    items = batch_item_re.findall(req)
+    assert len(items) == len(batch_commands)
+    assert len(batch_terminator_re.findall(req)) == 1, "Should have only one end of batch line."
     assert req[-2:] == "\n\n", "Should end with 2 clrfs"
 
     # POST batches have an additional line in Content-Type element header:
-    pat = re.compile(r"Content-Type: application\/json; type=entry")
-    assert len(re.findall(pat, req)) == len(list(filter(lambda x: x.method == RequestMethod.POST, batch_data)))
+    posts = sum(1 for x in batch_commands if x.method == RequestMethod.POST)
+    assert sum("; type=entry" in item for item in items) == posts
+
+
+def test_api_batch_large(client: DataverseClient, mocked_responses: responses.RequestsMock):
+    batch = "large"
+    batch_data = [BatchCommand(url="foo", method=RequestMethod.POST, data={"k": "v"}) for _ in range(1000)]
+
+    mocked_responses.post(url=f"{client._endpoint}$batch")
+
+    resp = client._batch_api_call(batch_data, id_generator=lambda: batch)
+
+    # Default batch size is 500 commands per request
+    assert len(resp) == 2
+    batch_item_re, batch_terminator_re = _batch_patterns(batch, client._endpoint)
+    for r in resp:
+        assert len(batch_item_re.findall(r.request.body)) == 500
+        assert len(batch_terminator_re.findall(r.request.body)) == 1
+
+
+def test_api_batch_default_id(
+    client: DataverseClient,
+    mocked_responses: responses.RequestsMock,
+    batch_commands: tuple[BatchCommand, ...],
+):
+    mocked_responses.post(url=f"{client._endpoint}$batch")
+
+    resp = client._batch_api_call(batch_commands)
+
+    # Without an id generator, batch ids default to random UUIDs
+    boundary = _BOUNDARY_RE.fullmatch(resp[0].request.headers["Content-Type"])
+    assert boundary is not None
+    assert _UUID4_RE.fullmatch(boundary["id"])
+    assert resp[0].request.body.endswith(f"--batch_{boundary['id']}--\n\n")
 
 
 @pytest.fixture
-def create_entity_response(client: DataverseClient, sample_entity: EntityMetadata):
+def create_entity_response(client: DataverseClient, sample_entity_payload: dict[str, Any]):
     return {
         "url": f"{client._endpoint}EntityDefinitions",
         "status": 204,
         "content_type": "application/json",
-        "match": [json_params_matcher(sample_entity.dump_to_dataverse())],
+        "match": [json_params_matcher(sample_entity_payload)],
     }
 
 
@@ -73,6 +157,7 @@ def test_create_entity(
     client: DataverseClient,
     mocked_responses: responses.RequestsMock,
     sample_entity: EntityMetadata,
+    sample_entity_payload: dict[str, Any],
     create_entity_response: dict[str, Any],
 ):
     # Mocking the request sent by endpoint
@@ -83,7 +168,7 @@ def test_create_entity(
     resp = client.create_entity(sample_entity)
 
     # Run some assertions that payload contains critical attributes
-    assert json.loads(resp.request.body) == sample_entity.dump_to_dataverse()
+    assert json.loads(resp.request.body) == sample_entity_payload
 
 
 def test_create_entity_with_solution_name(
@@ -100,52 +185,33 @@ def test_create_entity_with_solution_name(
     assert resp.request.headers["MSCRM.SolutionName"] == "Foo"
 
 
-def test_delete_entity(
-    client: DataverseClient,
-    mocked_responses: responses.RequestsMock,
-):
+def test_delete_entity(client: DataverseClient, mocker: MockerFixture):
     name = "Foo"
-
-    # Setting up response mock
-    url = f"{client._endpoint}EntityDefinitions(LogicalName='{name}')"
-    mocked_responses.delete(url=url)
+    api_call = mocker.patch.object(client, "_api_call", return_value=mocker.Mock(status_code=204))
 
     resp = client.delete_entity(logical_name=name)
 
-    assert resp.request.body is None
+    api_call.assert_called_once_with(method=RequestMethod.DELETE, url=f"EntityDefinitions(LogicalName='{name}')")
+    assert resp.status_code == 204
 
 
-def test_create_publisher(
-    client: DataverseClient,
-    mocked_responses: responses.RequestsMock,
-):
+def test_create_publisher(client: DataverseClient, mocker: MockerFixture):
     pub = Publisher("A", "B", "C", "D", 123)
-
-    mocked_responses.post(
-        url=f"{client._endpoint}publishers",
-        status=204,
-        match=[json_params_matcher(pub())],
-    )
+    api_call = mocker.patch.object(client, "_api_call", return_value=mocker.Mock(status_code=204))
 
     resp = client.create_publisher(publisher_definition=pub)
 
+    api_call.assert_called_once_with(method=RequestMethod.POST, url="publishers", json=pub())
     assert resp.status_code == 204
 
 
-def test_create_solution(
-    client: DataverseClient,
-    mocked_responses: responses.RequestsMock,
-):
+def test_create_solution(client: DataverseClient, mocker: MockerFixture):
     sol = Solution("A", "B", "C", "D")
-
-    mocked_responses.post(
-        url=f"{client._endpoint}solutions",
-        status=204,
-        match=[json_params_matcher(sol())],
-    )
+    api_call = mocker.patch.object(client, "_api_call", return_value=mocker.Mock(status_code=204))
 
     resp = client.create_solution(solution_definition=sol)
 
+    api_call.assert_called_once_with(method=RequestMethod.POST, url="solutions", json=sol())
     assert resp.status_code == 204
 
 
@@ -165,27 +231,23 @@ def test_create_relationship(
     assert resp.status_code == 204
 
 
-def test_get_language_codes(
-    client: DataverseClient,
-    mocked_responses: responses.RequestsMock,
-):
-    mocked_responses.get(
-        url=f"{client._endpoint}RetrieveAvailableLanguages",
-        status=200,
-        json={"LocaleIds": [123, 456], "Foo": "Bar"},
-    )
+def test_get_language_codes(client: DataverseClient, mocker: MockerFixture):
+    response = mocker.Mock()
+    response.json.return_value = {"LocaleIds": [123, 456], "Foo": "Bar"}
+    api_call = mocker.patch.object(client, "_api_call", return_value=response)
+
     resp = client.get_language_codes()
 
+    api_call.assert_called_once_with(method=RequestMethod.GET, url="RetrieveAvailableLanguages")
     assert resp == [123, 456]
 
 
-@pytest.fixture
 def test_get_entity_definition(
     client: DataverseClient,
     mocked_responses: responses.RequestsMock,
     sample_entity_definition: dict[str, Any],
     schema_name: str,
-) -> EntityMetadata:
+):
     mocked_responses.get(
         url=f"{client._endpoint}EntityDefinitions(LogicalName='foo')", status=200, json=sample_entity_definition
     )
@@ -197,39 +259,43 @@ def test_get_entity_definition(
     assert resp.ownership_type == OwnershipType.NONE
     assert resp.schema_name == schema_name
 
-    return resp
+
+@pytest.fixture(scope="session")
+def entity_definition(sample_entity_definition: dict[str, Any]) -> EntityMetadata:
+    # Parsed once, the HTTP round trip is covered by `test_get_entity_definition`
+    return EntityMetadata.model_validate_dataverse(sample_entity_definition)
 
 
 def test_update_entity(
     client: DataverseClient,
     mocked_responses: responses.RequestsMock,
-    test_get_entity_definition: EntityMetadata,
+    entity_definition: EntityMetadata,
     schema_name: str,
 ):
     mocked_responses.put(
         url=f"{client._endpoint}EntityDefinitions(LogicalName='{schema_name.lower()}')",
         status=204,
         match=[
-            json_params_matcher(test_get_entity_definition.dump_to_dataverse()),
+            json_params_matcher(entity_definition.dump_to_dataverse()),
             header_matcher({"Content-Type": "application/json; charset=utf-8"}),
         ],
     )
 
-    resp = client.update_entity(test_get_entity_definition)
+    resp = client.update_entity(entity_definition)
     assert resp.status_code == 204
 
 
 def test_update_entity_with_kwargs(
     client: DataverseClient,
     mocked_responses: responses.RequestsMock,
-    test_get_entity_definition: EntityMetadata,
+    entity_definition: EntityMetadata,
     schema_name: str,
 ):
     mocked_responses.put(
         url=f"{client._endpoint}EntityDefinitions(LogicalName='{schema_name.lower()}')",
         status=204,
         match=[
-            json_params_matcher(test_get_entity_definition.dump_to_dataverse()),
+            json_params_matcher(entity_definition.dump_to_dataverse()),
             header_matcher(
                 {
                     "Content-Type": "application/json; charset=utf-8",
@@ -240,5 +306,5 @@ def test_update_entity_with_kwargs(
         ],
     )
 
-    resp = client.update_entity(test_get_entity_definition, solution_name="foo", preserve_localized_labels=True)
+    resp = client.update_entity(entity_definition, solution_name="foo", preserve_localized_labels=True)
     assert resp.status_code == 204
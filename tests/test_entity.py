@@ -1,13 +1,15 @@
+import json
 import logging
 import random
-from copy import deepcopy
+import re
 from datetime import date, datetime
 from uuid import uuid4
 
 import pandas as pd
 import pytest
+import requests
 import responses
-from responses.matchers import header_matcher, json_params_matcher, query_param_matcher
+from responses.matchers import body_matcher, header_matcher, json_params_matcher, query_param_matcher
 
 from dataverse_api.dataverse import DataverseClient
 from dataverse_api.entity import DataverseEntity
@@ -15,71 +17,83 @@ from dataverse_api.errors import DataverseError
 from dataverse_api.metadata.base import BASE_TYPE
 from dataverse_api.utils.data import serialize_json
 
+_ENTITY_SET_SELECT = query_param_matcher({"$select": "EntitySetName,PrimaryIdAttribute,PrimaryImageAttribute"})
+_ENTITY_KEYS_SELECT = query_param_matcher({"$select": "SchemaName,KeyAttributes"})
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def entity_name() -> str:
     return "foo"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def entity_set_name() -> str:
     return "foos"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def primary_id() -> str:
     return "fooid"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def primary_img() -> str:
     return "fooimg"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def altkey_1(primary_id: str) -> tuple[str, list[str]]:
     return "foo_key", [primary_id]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def altkey_2_name() -> str:
     return "blergh"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def altkey_2_cols() -> list[str]:
     return ["moo", "mee"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def altkey_2(altkey_2_name: str, altkey_2_cols: list[str]) -> tuple[str, list[str]]:
     return altkey_2_name, altkey_2_cols
 
 
+_SAMPLE_DATA = {"value": [{"data": 1}, {"data": 2}]}
+
+
 @pytest.fixture
 def sample_data():
-    return {"value": [{"data": 1}, {"data": 2}]}
+    # Shallow copy, tests only ever add top-level keys such as `@odata.nextLink`
+    return _SAMPLE_DATA.copy()
 
 
-@pytest.fixture
+# Generated once at import, the data packages are shared and must not be mutated by tests
+_SMALL_DATA_PACKAGE = [{"test": str(uuid4())} for _ in range(5)]
+_MEDIUM_DATA_PACKAGE = [{"test": str(uuid4())} for _ in range(100)]
+_LARGE_DATA_PACKAGE = [{"test": str(uuid4())} for _ in range(2000)]
+
+
+@pytest.fixture(scope="session")
 def small_data_package():
-    return [{"test": str(uuid4())} for _ in range(5)]
+    return _SMALL_DATA_PACKAGE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def medium_data_package():
-    return [{"test": str(uuid4())} for _ in range(100)]
+    return _MEDIUM_DATA_PACKAGE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def large_data_package():
-    return [{"test": str(uuid4())} for _ in range(2000)]
+    return _LARGE_DATA_PACKAGE
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def entity(
     client: DataverseClient,
-    mocked_responses: responses.RequestsMock,
     entity_name: str,
     entity_set_name: str,
     primary_id: str,
@@ -87,82 +101,102 @@ def entity(
     altkey_1: tuple[str, list[str]],
     altkey_2: tuple[str, list[str]],
 ):
-    # Initial call
-    columns = ["EntitySetName", "PrimaryIdAttribute", "PrimaryImageAttribute"]
-    mocked_responses.get(
-        url=client._endpoint + f"EntityDefinitions(LogicalName='{entity_name}')",
-        status=200,
-        match=[query_param_matcher({"$select": ",".join(columns)})],
-        json={"EntitySetName": entity_set_name, "PrimaryIdAttribute": primary_id, "PrimaryImageAttribute": primary_img},
-    )
+    # The metadata lookups only run once per module, against their own mock,
+    # so the per-test `mocked_responses` only ever holds the test's own calls
+    with responses.RequestsMock() as mocked_responses:
+        # Initial call
+        mocked_responses.get(
+            url=client._endpoint + f"EntityDefinitions(LogicalName='{entity_name}')",
+            status=200,
+            match=[_ENTITY_SET_SELECT],
+            json={
+                "EntitySetName": entity_set_name,
+                "PrimaryIdAttribute": primary_id,
+                "PrimaryImageAttribute": primary_img,
+            },
+        )
 
-    # Keys call
-    columns = ["SchemaName", "KeyAttributes"]
-    mocked_responses.get(
-        url=client._endpoint + f"EntityDefinitions(LogicalName='{entity_name}')/Keys",
-        status=200,
-        match=[query_param_matcher({"$select": ",".join(columns)})],
-        json={
-            "value": [
-                {"SchemaName": altkey_1[0], "KeyAttributes": altkey_1[1]},
-                {"SchemaName": altkey_2[0], "KeyAttributes": altkey_2[1]},
-            ]
-        },
-    )
+        # Keys call
+        mocked_responses.get(
+            url=client._endpoint + f"EntityDefinitions(LogicalName='{entity_name}')/Keys",
+            status=200,
+            match=[_ENTITY_KEYS_SELECT],
+            json={
+                "value": [
+                    {"SchemaName": altkey_1[0], "KeyAttributes": altkey_1[1]},
+                    {"SchemaName": altkey_2[0], "KeyAttributes": altkey_2[1]},
+                ]
+            },
+        )
 
-    # Action SDK Messages call
-    mocked_responses.get(
-        url=client._endpoint + "sdkmessagefilters",
-        match=[
-            query_param_matcher(
-                {
-                    "$select": "sdkmessagefilterid",
-                    "$expand": "sdkmessageid($select=name)",
-                    "$filter": (
-                        "(sdkmessageid/name eq 'CreateMultiple' or "
-                        + "sdkmessageid/name eq 'UpdateMultiple') and "
-                        + f"primaryobjecttypecode eq '{entity_name}'"
-                    ),
-                }
-            )
-        ],
-        json={
-            "value": [
-                {"sdkmessageid": {"name": "CreateMultiple"}},
-                {"sdkmessageid": {"name": "UpdateMultiple"}},
-            ]
-        },
-    )
+        # Action SDK Messages call
+        mocked_responses.get(
+            url=client._endpoint + "sdkmessagefilters",
+            match=[
+                query_param_matcher(
+                    {
+                        "$select": "sdkmessagefilterid",
+                        "$expand": "sdkmessageid($select=name)",
+                        "$filter": (
+                            "(sdkmessageid/name eq 'CreateMultiple' or "
+                            + "sdkmessageid/name eq 'UpdateMultiple') and "
+                            + f"primaryobjecttypecode eq '{entity_name}'"
+                        ),
+                    }
+                )
+            ],
+            json={
+                "value": [
+                    {"sdkmessageid": {"name": "CreateMultiple"}},
+                    {"sdkmessageid": {"name": "UpdateMultiple"}},
+                ]
+            },
+        )
 
-    # Relationships calls
-    refd_entity = "ReferencedEntityNavigationPropertyName"
-    reffing_entity = "ReferencingEntityNavigationPropertyName"
+        # Relationships calls
+        refd_entity = "ReferencedEntityNavigationPropertyName"
+        reffing_entity = "ReferencingEntityNavigationPropertyName"
+
+        # One-to-many
+        mocked_responses.get(
+            url=client._endpoint + f"EntityDefinitions(LogicalName='{entity_name}')/ManyToOneRelationships",
+            json={
+                "value": [
+                    {refd_entity: "123", reffing_entity: "foo"},
+                    {refd_entity: "456", reffing_entity: "bar"},
+                    {refd_entity: "789", reffing_entity: "baz"},
+                ]
+            },
+        )
 
-    # One-to-many
-    mocked_responses.get(
-        url=client._endpoint + f"EntityDefinitions(LogicalName='{entity_name}')/ManyToOneRelationships",
-        json={
-            "value": [
-                {refd_entity: "123", reffing_entity: "foo"},
-                {refd_entity: "456", reffing_entity: "bar"},
-                {refd_entity: "789", reffing_entity: "baz"},
-            ]
-        },
-    )
+        # Many-to-one
+        mocked_responses.get(
+            url=client._endpoint + f"EntityDefinitions(LogicalName='{entity_name}')/OneToManyRelationships",
+            json={
+                "value": [
+                    {refd_entity: "foo", reffing_entity: "bar"},
+                    {refd_entity: "moo", reffing_entity: f"objectid_{entity_name}"},
+                    {refd_entity: "schmoo", reffing_entity: f"regardingobjectid_{entity_name}"},
+                ]
+            },
+        )
 
-    # Many-to-one
-    mocked_responses.get(
-        url=client._endpoint + f"EntityDefinitions(LogicalName='{entity_name}')/OneToManyRelationships",
-        json={
-            "value": [
-                {refd_entity: "foo", reffing_entity: "bar"},
-                {refd_entity: "moo", reffing_entity: f"objectid_{entity_name}"},
-                {refd_entity: "schmoo", reffing_entity: f"regardingobjectid_{entity_name}"},
-            ]
-        },
-    )
+        return client.entity(entity_name)
+
+
+def _record_row_calls(
+    mocked_responses: responses.RequestsMock, method: str, entity: DataverseEntity, suffix: str = ""
+) -> list[tuple[tuple[str, ...], str | None]]:
+    # Serves every row-wise request to the entity set, recording the URL groups and body of each call
+    url = re.compile(rf"{re.escape(entity._endpoint + entity.entity_set_name)}\((.+)\){suffix}")
+    calls: list[tuple[tuple[str, ...], str | None]] = []
 
-    return client.entity(entity_name)
+    def callback(request: requests.PreparedRequest) -> tuple[int, dict[str, str], str]:
+        calls.append((url.fullmatch(request.url).groups(), request.body))
+        return 204, {}, ""
+
+    mocked_responses.add_callback(method, url=url, callback=callback)
+    return calls
 
 
 def test_entity_instantiation(
@@ -179,7 +213,7 @@ def test_entity_instantiation(
     assert entity.primary_id_attr == primary_id
     assert entity.primary_img_attr == primary_img
     assert len(entity.alternate_keys) == 2
-    assert all(i in entity.alternate_keys for i in [altkey_1[0], altkey_2[0]])
+    assert {altkey_1[0], altkey_2[0]} <= entity.alternate_keys.keys()
     assert entity.alternate_keys[altkey_1[0]] == altkey_1[1]
     assert entity.alternate_keys[altkey_2[0]] == altkey_2[1]
     assert entity.supports_create_multiple is True
@@ -245,8 +279,10 @@ def test_entity_read_with_paging(
     # Performing action
     resp = entity.read()
 
-    assert len(resp) == 2 * len(sample_data["value"])
-    assert resp == sample_data["value"] * 2
+    # One page from each of the two responses
+    n = len(sample_data["value"])
+    assert len(resp) == 2 * n
+    assert resp[:n] == resp[n:] == sample_data["value"]
 
 
 """
@@ -254,103 +290,106 @@ entity.create()
 """
 
 
-def test_entity_create_by_singles(
+@pytest.mark.parametrize(
+    "mode, expected_log, expected_requests",
+    [
+        ("individual", "using individual inserts", 5),
+        ("multiple", "using CreateMultiple", 1),
+        ("batch", "using batch", 1),
+    ],
+    ids=["individual", "multiple", "batch"],
+)
+def test_entity_create_by_mode(
     entity: DataverseEntity,
     mocked_responses: responses.RequestsMock,
     small_data_package: list[dict[str, str]],
     caplog: pytest.LogCaptureFixture,
+    mode: str,
+    expected_log: str,
+    expected_requests: int,
 ):
-    # Data package
-    url = entity._endpoint + entity.entity_set_name
-
-    # Mock single requests
-    for row in small_data_package:
-        mocked_responses.post(url=url, match=[json_params_matcher(row)], status=204)
+    # Mock request, serving every POST to the endpoint regardless of mode
+    mocked_responses.post(url=re.compile(re.escape(entity._endpoint) + ".+"), status=204)
 
-    caplog.set_level(logging.DEBUG)
-    resp = entity.create(data=small_data_package)
+    caplog.set_level(logging.DEBUG, logger="dataverse_api.entity")
+    resp = entity.create(small_data_package, mode=mode)
 
-    assert all([x.status_code == 204 for x in resp])
-    assert "using individual inserts" in caplog.text
+    assert {x.status_code for x in resp} == {204}
+    assert len(mocked_responses.calls) == expected_requests
+    assert not any("@odata.type" in row for row in small_data_package)
+    assert expected_log in caplog.text
 
 
-def test_entity_create_by_singles_write_timestamp(
+def test_entity_create_by_singles(
     entity: DataverseEntity,
     mocked_responses: responses.RequestsMock,
     small_data_package: list[dict[str, str]],
-    caplog: pytest.LogCaptureFixture,
 ):
-    # Data package
-    url = entity._endpoint + entity.entity_set_name
-    data = [{"test": datetime.utcnow()}, {"test": date.today()}, {"test": pd.Timestamp.now()}]
+    # Mock request, reused for every single request
+    mocked_responses.post(url=entity._endpoint + entity.entity_set_name, status=204)
 
-    # Mock single requests
-    for row in data:
-        row_data = {k: v.isoformat() for k, v in row.items()}
-        mocked_responses.post(url=url, match=[json_params_matcher(row_data)], status=204)
+    entity.create(small_data_package, mode="individual")
 
-    caplog.set_level(logging.DEBUG)
-    resp = entity.create(data=data)
-
-    assert all([x.status_code == 204 for x in resp])
-    assert "using individual inserts" in caplog.text
+    assert [call.request.body for call in mocked_responses.calls] == [serialize_json(row) for row in small_data_package]
 
 
 def test_entity_create_by_createmultiple(
     entity: DataverseEntity,
     mocked_responses: responses.RequestsMock,
     medium_data_package: list[dict[str, str]],
-    caplog: pytest.LogCaptureFixture,
 ):
     # Data package
-    out_data = deepcopy(medium_data_package)
-    for row in out_data:
-        row["@odata.type"] = BASE_TYPE + entity.logical_name
-    match_data = {"Targets": out_data}
-    url = f"{entity._endpoint}{entity.entity_set_name}/{BASE_TYPE + 'CreateMultiple'}"
+    targets = [{**row, "@odata.type": BASE_TYPE + entity.logical_name} for row in medium_data_package]
+    url = f"{entity._endpoint}{entity.entity_set_name}/{BASE_TYPE}CreateMultiple"
+
     # Mock request
-    mocked_responses.post(url=url, match=[json_params_matcher(match_data)], status=204)
+    mocked_responses.post(url=url, match=[body_matcher(serialize_json({"Targets": targets}))], status=204)
 
-    caplog.set_level(logging.DEBUG)
     resp = entity.create(medium_data_package, mode="multiple")
 
-    assert all([x.status_code == 204 for x in resp])
-    assert "using CreateMultiple" in caplog.text
+    # The mock only matches the typed Targets payload
+    assert [x.status_code for x in resp] == [204]
 
 
-def test_entity_create_multiple_not_supported(
+def test_entity_create_by_singles_write_timestamp(
     entity: DataverseEntity,
-    medium_data_package: list[dict[str, str]],
+    ordered_responses: responses.RequestsMock,
+    small_data_package: list[dict[str, str]],
+    caplog: pytest.LogCaptureFixture,
 ):
-    # Setup
-    entity._DataverseEntity__supports_create_multiple = False  # Ugh!
+    # Data package
+    url = entity._endpoint + entity.entity_set_name
+    data = [{"test": datetime.utcnow()}, {"test": date.today()}, {"test": pd.Timestamp.now()}]
+
+    # Mock single requests
+    for row in data:
+        row_data = {k: v.isoformat() for k, v in row.items()}
+        ordered_responses.post(url=url, match=[json_params_matcher(row_data)], status=204)
+
+    caplog.set_level(logging.DEBUG, logger="dataverse_api.entity")
+    resp = entity.create(data=data)
 
-    with pytest.raises(DataverseError, match=r"CreateMultiple is not supported.*"):
-        entity.create(medium_data_package, mode="multiple")
+    assert {x.status_code for x in resp} == {204}
+    assert "using individual inserts" in caplog.text
 
 
-def test_entity_create_by_batch(
+def test_entity_create_multiple_not_supported(
     entity: DataverseEntity,
-    mocked_responses: responses.RequestsMock,
     medium_data_package: list[dict[str, str]],
-    caplog: pytest.LogCaptureFixture,
 ):
-    # Data package
-    url = f"{entity._endpoint}$batch"
-
-    # Mock request
-    mocked_responses.post(url=url, status=204)
-
-    caplog.set_level(logging.DEBUG)
-    resp = entity.create(medium_data_package, mode="batch")
+    # Setup, restored afterwards as the entity is shared across the module
+    entity._DataverseEntity__supports_create_multiple = False  # Ugh!
 
-    assert all([x.status_code == 204 for x in resp])
-    assert "using batch" in caplog.text
+    try:
+        with pytest.raises(DataverseError, match=r"CreateMultiple is not supported.*"):
+            entity.create(medium_data_package, mode="multiple")
+    finally:
+        entity._DataverseEntity__supports_create_multiple = True
 
 
 def test_entity_create_with_args(
     entity: DataverseEntity,
-    mocked_responses: responses.RequestsMock,
+    ordered_responses: responses.RequestsMock,
     small_data_package: list[dict[str, str]],
 ):
     # Data package
@@ -359,15 +398,15 @@ def test_entity_create_with_args(
 
     # Mock single requests
     for _ in small_data_package:
-        mocked_responses.post(url=url, match=[header_matcher(header)], status=200)
+        ordered_responses.post(url=url, match=[header_matcher(header)], status=200)
 
     resp = entity.create(data=small_data_package, detect_duplicates=True, return_created=True)
-    assert all([x.status_code == 200 for x in resp])
+    assert {x.status_code for x in resp} == {200}
 
 
 def test_entity_create_with_df(
     entity: DataverseEntity,
-    mocked_responses: responses.RequestsMock,
+    ordered_responses: responses.RequestsMock,
 ):
     data = pd.DataFrame([("abc"), ("def")], columns=["test"])
     dict_data = data.to_dict(orient="records")
@@ -375,11 +414,11 @@ def test_entity_create_with_df(
     url = entity._endpoint + entity.entity_set_name
 
     for row in dict_data:
-        mocked_responses.post(url=url, status=204, match=[json_params_matcher(row)])
+        ordered_responses.post(url=url, status=204, match=[body_matcher(serialize_json(row))])
 
     resp = entity.create(data=data)
 
-    assert all([x.status_code == 204 for x in resp])
+    assert {x.status_code for x in resp} == {204}
 
 
 def test_entity_create_mode_not_supported(
@@ -410,15 +449,12 @@ def test_entity_delete_singles_all(entity: DataverseEntity, mocked_responses: re
     )
 
     # Deleting ids
-    for row in return_payload:
-        mocked_responses.delete(
-            url=f"{entity._endpoint}{entity.entity_set_name}({row[id]})",
-            status=204,
-        )
+    calls = _record_row_calls(mocked_responses, responses.DELETE, entity)
 
     resp = entity.delete(filter="all")
 
-    assert all([x.status_code == 204 for x in resp])
+    assert {x.status_code for x in resp} == {204}
+    assert sorted(groups[0] for groups, _ in calls) == sorted(row[id] for row in return_payload)
 
 
 def test_entity_delete_batch_all(entity: DataverseEntity, mocked_responses: responses.RequestsMock):
@@ -440,24 +476,26 @@ def test_entity_delete_batch_all(entity: DataverseEntity, mocked_responses: resp
 
     resp = entity.delete(mode="batch", filter="all")
 
-    for item in return_payload:
-        assert f"{entity._endpoint}{entity.entity_set_name}({item[id]})" in resp[0].request.body
+    body = resp[0].request.body
+    expected = [f"{entity._endpoint}{entity.entity_set_name}({item[id]})" for item in return_payload]
+    missing = [url for url in expected if url not in body]
+    assert not missing
 
 
-def test_entity_delete_singles_ids(entity: DataverseEntity, mocked_responses: responses.RequestsMock):
+def test_entity_delete_singles_ids(entity: DataverseEntity, ordered_responses: responses.RequestsMock):
     # Setup
     delete_ids = {"1", "2", "3"}
 
     # Deleting ids
     for item in delete_ids:
-        mocked_responses.delete(
+        ordered_responses.delete(
             url=f"{entity._endpoint}{entity.entity_set_name}({item})",
             status=204,
         )
 
     resp = entity.delete(ids=delete_ids)
 
-    assert all([x.status_code == 204 for x in resp])
+    assert {x.status_code for x in resp} == {204}
 
 
 def test_entity_delete_singles_filter(entity: DataverseEntity, mocked_responses: responses.RequestsMock):
@@ -481,7 +519,7 @@ def test_entity_delete_singles_filter(entity: DataverseEntity, mocked_responses:
 
     resp = entity.delete(filter=filter_str)
 
-    assert all([x.status_code == 204 for x in resp])
+    assert {x.status_code for x in resp} == {204}
 
 
 def test_entity_delete_bad_args(entity: DataverseEntity):
@@ -515,13 +553,12 @@ def test_entity_delete_column_singles_all(entity: DataverseEntity, mocked_respon
     )
 
     # Deleting ids
-    for row in return_payload:
-        for col in columns:
-            mocked_responses.delete(url=f"{entity._endpoint}{entity.entity_set_name}({row[id]})/{col}", status=204)
+    calls = _record_row_calls(mocked_responses, responses.DELETE, entity, suffix="/(.+)")
 
     resp = entity.delete_columns(columns=columns, filter="all")
 
-    assert all([x.status_code == 204 for x in resp])
+    assert {x.status_code for x in resp} == {204}
+    assert sorted(groups for groups, _ in calls) == sorted((row[id], col) for row in return_payload for col in columns)
 
 
 def test_entity_delete_column_batch_all(entity: DataverseEntity, mocked_responses: responses.RequestsMock):
@@ -544,27 +581,30 @@ def test_entity_delete_column_batch_all(entity: DataverseEntity, mocked_response
 
     resp = entity.delete_columns(mode="batch", columns=columns, filter="all")
 
-    for item in return_payload:
-        for i, col in enumerate(columns):
-            assert f"{entity._endpoint}{entity.entity_set_name}({item[id]})/{col}" in resp[i].request.body
+    # One batch per column
+    for response, col in zip(resp, columns, strict=True):
+        body = response.request.body
+        expected = [f"{entity._endpoint}{entity.entity_set_name}({item[id]})/{col}" for item in return_payload]
+        missing = [url for url in expected if url not in body]
+        assert not missing
 
 
-def test_entity_delete_column_singles_ids(entity: DataverseEntity, mocked_responses: responses.RequestsMock):
+def test_entity_delete_column_singles_ids(entity: DataverseEntity, ordered_responses: responses.RequestsMock):
     # Setup
     delete_ids = {"1", "2", "3"}
     columns = ["Foo", "Bar"]
 
-    # Deleting ids
+    # Deleting ids, per column and then per id as in `delete_columns`
     for col in columns:
         for item in delete_ids:
-            mocked_responses.delete(
+            ordered_responses.delete(
                 url=f"{entity._endpoint}{entity.entity_set_name}({item})/{col}",
                 status=204,
             )
 
     resp = entity.delete_columns(columns=columns, ids=delete_ids)
 
-    assert all([x.status_code == 204 for x in resp])
+    assert {x.status_code for x in resp} == {204}
 
 
 def test_entity_delete_column_singles_filter(entity: DataverseEntity, mocked_responses: responses.RequestsMock):
@@ -590,7 +630,7 @@ def test_entity_delete_column_singles_filter(entity: DataverseEntity, mocked_res
 
     resp = entity.delete_columns(columns=columns, filter=filter_str)
 
-    assert all([x.status_code == 204 for x in resp])
+    assert {x.status_code for x in resp} == {204}
 
 
 def test_entity_delete_column_bad_args(entity: DataverseEntity):
@@ -615,21 +655,15 @@ def test_entity_upsert_individual_primaryid(
 ):
     # Setup
     data = [{primary_id: str(uuid4()), "test_val": random.randint(1, 10)} for _ in range(4)]
+    expected = {row[primary_id]: {k: v for k, v in row.items() if k != primary_id} for row in data}
 
-    for row in data:
-        id = row[primary_id]
-        payload = {k: v for k, v in row.items() if k != primary_id}
-
-        mocked_responses.patch(
-            url=f"{entity._endpoint}{entity.entity_set_name}({id})",
-            match=[json_params_matcher(payload)],
-            status=204,
-        )
+    calls = _record_row_calls(mocked_responses, responses.PATCH, entity)
 
     resp = entity.upsert(data, mode="individual")
 
     for row in resp:
         assert row.status_code == 204
+    assert {groups[0]: json.loads(body) for groups, body in calls} == expected
 
 
 def test_entity_upsert_batch_primaryid(
@@ -692,7 +726,7 @@ def test_entity_upsert_bad_altkey(entity: DataverseEntity):
         entity.upsert({"data": 1}, altkey_name="foo")
 
 
-def test_entity_upsert_dataframe(entity: DataverseEntity, mocked_responses: responses.RequestsMock, primary_id: str):
+def test_entity_upsert_dataframe(entity: DataverseEntity, ordered_responses: responses.RequestsMock, primary_id: str):
     # Setup
     df = pd.DataFrame([{primary_id: str(uuid4()), "data": i} for i in range(3)])
 
@@ -700,9 +734,9 @@ def test_entity_upsert_dataframe(entity: DataverseEntity, mocked_responses: resp
         id = row[primary_id]
         payload = {k: v for k, v in row.items() if k != primary_id}
 
-        mocked_responses.patch(
+        ordered_responses.patch(
             url=f"{entity._endpoint}{entity.entity_set_name}({id})",
-            match=[json_params_matcher(payload)],
+            match=[body_matcher(serialize_json(payload))],
             status=204,
         )
 
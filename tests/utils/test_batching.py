@@ -1,8 +1,20 @@
-from textwrap import dedent
+import pytest
 
-from dataverse_api.utils.batching import BatchCommand, RequestMethod
+from dataverse_api.utils.batching import BatchCommand, RequestMethod, chunk_data, transform_upsert_data
 from dataverse_api.utils.data import serialize_json
 
+_EXPECTED_OUTPUT = (
+    "--{batch_id}\n"
+    "Content-Type: application/http\n"
+    "Content-Transfer-Encoding: binary\n"
+    "\n"
+    "{request} HTTP/1.1\n"
+    "{content_type}\n"
+    "{extra_header}\n"
+    "\n"
+    "{body}\n"
+)
+
 
 def test_batch_command_delete():
     url = "foo"
@@ -10,22 +22,18 @@ def test_batch_command_delete():
     batch_id = "123"
     api_url = "http://test.com"
 
-    expected_output = f"""\
-    --{batch_id}
-    Content-Type: application/http
-    Content-Transfer-Encoding: binary
-
-    {method.name} {api_url}/{url} HTTP/1.1
-    Content-Type: application/json
-
-
-
-    """
+    expected_output = _EXPECTED_OUTPUT.format(
+        batch_id=batch_id,
+        request=f"{method.name} {api_url}/{url}",
+        content_type="Content-Type: application/json",
+        extra_header="",
+        body="",
+    )
 
     command = BatchCommand(url=url, method=method)
     assert command.single_col is False
     assert command.content_type == "Content-Type: application/json"
-    assert command.encode(batch_id=batch_id, api_url=api_url) == dedent(expected_output)
+    assert command.encode(batch_id=batch_id, api_url=api_url) == expected_output
 
 
 def test_batch_command_post():
@@ -35,22 +43,18 @@ def test_batch_command_post():
     api_url = "http://test.com"
     data = {"test": 123}
 
-    expected_output = f"""\
-    --{batch_id}
-    Content-Type: application/http
-    Content-Transfer-Encoding: binary
-
-    {method.name} {api_url}/{url} HTTP/1.1
-    Content-Type: application/json; type=entry
-
-
-    {serialize_json(data)}
-    """
+    expected_output = _EXPECTED_OUTPUT.format(
+        batch_id=batch_id,
+        request=f"{method.name} {api_url}/{url}",
+        content_type="Content-Type: application/json; type=entry",
+        extra_header="",
+        body=serialize_json(data),
+    )
 
     command = BatchCommand(url=url, method=method, data=data)
     assert command.single_col is False
     assert command.content_type == "Content-Type: application/json; type=entry"
-    assert command.encode(batch_id=batch_id, api_url=api_url) == dedent(expected_output)
+    assert command.encode(batch_id=batch_id, api_url=api_url) == expected_output
 
 
 def test_batch_command_patch_with_header():
@@ -61,57 +65,102 @@ def test_batch_command_patch_with_header():
     data = {"test": 123}
     header = {"MSCRM.SuppressDuplicateDetection": "false"}
 
-    expected_output = f"""\
-    --{batch_id}
-    Content-Type: application/http
-    Content-Transfer-Encoding: binary
-
-    {method.name} {api_url}/{url} HTTP/1.1
-    Content-Type: application/json
-    MSCRM.SuppressDuplicateDetection: false
-
-    {serialize_json(data)}
-    """
+    expected_output = _EXPECTED_OUTPUT.format(
+        batch_id=batch_id,
+        request=f"{method.name} {api_url}/{url}",
+        content_type="Content-Type: application/json",
+        extra_header="MSCRM.SuppressDuplicateDetection: false",
+        body=serialize_json(data),
+    )
 
     command = BatchCommand(url=url, method=method, data=data, headers=header)
     assert command.single_col is False
     assert command.headers == header
     assert command.content_type == "Content-Type: application/json"
-    assert command.encode(batch_id=batch_id, api_url=api_url) == dedent(expected_output)
+    assert command.encode(batch_id=batch_id, api_url=api_url) == expected_output
 
 
-def test_batch_command_put():
-    url = "foo(row_id)"
-    method = RequestMethod.PUT
+def test_batch_command_patch_with_multiple_headers():
+    url = "foo"
+    method = RequestMethod.PATCH
     batch_id = "123"
     api_url = "http://test.com"
     data = {"test": 123}
+    header = {"MSCRM.SuppressDuplicateDetection": "false", "Prefer": "return=representation"}
 
-    expected_output = f"""\
-    --{batch_id}
-    Content-Type: application/http
-    Content-Transfer-Encoding: binary
+    expected_output = _EXPECTED_OUTPUT.format(
+        batch_id=batch_id,
+        request=f"{method.name} {api_url}/{url}",
+        content_type="Content-Type: application/json",
+        extra_header="MSCRM.SuppressDuplicateDetection: false\nPrefer: return=representation",
+        body=serialize_json(data),
+    )
 
-    {method.name} {api_url}/{url}/{list(data.keys())[0]} HTTP/1.1
-    Content-Type: application/json
+    command = BatchCommand(url=url, method=method, data=data, headers=header)
+    assert command.encode(batch_id=batch_id, api_url=api_url) == expected_output
 
 
-    {{{'"value"'}: {data['test']}}}
-    """
+def test_batch_command_put():
+    url = "foo(row_id)"
+    method = RequestMethod.PUT
+    batch_id = "123"
+    api_url = "http://test.com"
+    data = {"test": 123}
+
+    expected_output = _EXPECTED_OUTPUT.format(
+        batch_id=batch_id,
+        request=f"{method.name} {api_url}/{url}/{list(data.keys())[0]}",
+        content_type="Content-Type: application/json",
+        extra_header="",
+        body=serialize_json({"value": data["test"]}),
+    )
 
     command = BatchCommand(url=url, method=method, data=data)
     assert command.single_col is True
     assert command.content_type == "Content-Type: application/json"
-    assert command.encode(batch_id=batch_id, api_url=api_url) == dedent(expected_output)
+    assert command.encode(batch_id=batch_id, api_url=api_url) == expected_output
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("hello(altkey='æøå')", "hello(altkey='%C3%A6%C3%B8%C3%A5')"),
+        ("kenobi(altkey='hello there')", "kenobi(altkey='hello%20there')"),
+    ],
+    ids=["letters", "space"],
+)
+def test_batch_altkey_encoding(url: str, expected: str):
+    batch = BatchCommand(url=url, method=RequestMethod.GET)
+    assert batch.url == expected
 
 
-def test_batch_altkey_encoding_letters():
-    url = "hello(altkey='æøå')"
-    batch = BatchCommand(url=url, method=RequestMethod.GET)
-    assert batch.url == "hello(altkey='%C3%A6%C3%B8%C3%A5')"
+def test_chunk_data():
+    data = [BatchCommand(url=f"foo({i})", method=RequestMethod.DELETE) for i in range(5)]
 
+    chunks = list(chunk_data(data, size=2))
 
-def test_batch_altkey_encoding_space():
-    url = "kenobi(altkey='hello there')"
-    batch = BatchCommand(url=url, method=RequestMethod.GET)
-    assert batch.url == "kenobi(altkey='hello%20there')"
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [command for chunk in chunks for command in chunk] == data
+
+
+def test_transform_upsert_data_altkey():
+    data = [{"b": 1, "a": "x", "val": 1.5}, {"b": 2, "a": "y", "val": 2.5}]
+
+    # Keys may be any iterable, and are used in the given order for every row
+    out = list(transform_upsert_data(data, iter(["a", "b"]), is_primary_id=False))
+
+    assert out == [("a='x',b=1", {"val": 1.5}), ("a='y',b=2", {"val": 2.5})]
+
+
+def test_transform_upsert_data_altkey_bool():
+    out = list(transform_upsert_data([{"flag": True, "val": 1}], ["flag"], is_primary_id=False))
+
+    assert out == [("flag=True", {"val": 1})]
+
+
+def test_transform_upsert_data_primary_id():
+    data = [{"id": "abc", "val": 1}]
+
+    out = list(transform_upsert_data(data, ["id"], is_primary_id=True))
+
+    assert out == [("abc", {"val": 1})]
@@ -1,52 +1,36 @@
+from typing import Any
+
 import pytest
 
 from dataverse_api.metadata.complex_properties import Label
 from dataverse_api.utils.labels import define_label
 
 
-@pytest.fixture
-def label_name() -> str:
-    return "test"
-
-
 def test_define_label_with_label(label: Label):
     lbl = define_label(label)
 
     assert lbl == label
 
 
-def test_define_label_with_str(label_name: str):
-    lbl = define_label(label_name)
-
-    assert len(lbl.localized_labels) == 1
-    assert lbl.localized_labels[0].label == label_name
-    assert lbl.localized_labels[0].language_code == 1033
-
-
-def test_define_label_without_arg():
-    lbl = define_label()
-
-    assert len(lbl.localized_labels) == 1
-    assert lbl.localized_labels[0].label == "Label"
-    assert lbl.localized_labels[0].language_code == 1033
-
-
-def test_define_label_with_str_and_lang_code(label_name: str):
-    lbl = define_label(label_name, language_code=123)
-
-    assert len(lbl.localized_labels) == 1
-    assert lbl.localized_labels[0].label == label_name
-    assert lbl.localized_labels[0].language_code == 123
-
-
-def test_define_label_with_none_and_override():
-    lbl = define_label(label=None, override="hello")
+@pytest.mark.parametrize(
+    "kwargs, expected_label, expected_language_code",
+    [
+        ({"label": "Test"}, "Test", 1033),
+        ({}, "Label", 1033),
+        ({"label": "Test", "language_code": 123}, "Test", 123),
+        ({"label": None, "override": "hello"}, "hello", 1033),
+    ],
+    ids=["str", "without_arg", "str_and_lang_code", "none_and_override"],
+)
+def test_define_label(kwargs: dict[str, Any], expected_label: str, expected_language_code: int):
+    lbl = define_label(**kwargs)
 
     assert len(lbl.localized_labels) == 1
-    assert lbl.localized_labels[0].label == "hello"
-    assert lbl.localized_labels[0].language_code == 1033
+    assert lbl.localized_labels[0].label == expected_label
+    assert lbl.localized_labels[0].language_code == expected_language_code
 
 
-def test_define_label_error():
+@pytest.mark.parametrize("kwargs", [{"label": 123}, {"label": "Test", "language_code": "1033"}])
+def test_define_label_error(kwargs: dict[str, Any]):
     with pytest.raises(TypeError, match="Wrong type supplied!"):
-        define_label(label=123)  # type: ignore
+        define_label(**kwargs)
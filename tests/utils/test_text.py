@@ -1,3 +1,8 @@
+import sys
+from urllib.parse import quote
+
+import pytest
+
 from dataverse_api.utils.text import convert_dict_keys_to_snake, convert_dict_keys_to_title, encode_altkeys
 
 
@@ -31,8 +36,43 @@ def test_conversion_to_snake():
     assert out["@whatever"] == test_dict["@whatever"]
 
 
-def test_altkeys_encode():
-    assert encode_altkeys("øøå('æø')") == "øøå('%C3%A6%C3%B8')"
-    assert encode_altkeys("abc('x x')") == "abc('x%20x')"
-    assert encode_altkeys("abc(stuff='æ',more='abc')") == "abc(stuff='%C3%A6',more='abc')"
-    assert encode_altkeys("abc(stuff='abc',more='æ')") == "abc(stuff='abc',more='%C3%A6')"
+def test_conversion_deeply_nested():
+    depth = sys.getrecursionlimit() + 100
+
+    nested: dict = {"leaf_value": 1}
+    for _ in range(depth):
+        nested = {"child_item": nested}
+
+    out = convert_dict_keys_to_title(nested)
+    back = convert_dict_keys_to_snake(out)
+
+    for _ in range(depth):
+        out = out["ChildItem"]
+        back = back["child_item"]
+    assert out == {"LeafValue": 1}
+    assert back == {"leaf_value": 1}
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("øøå('æø')", "øøå('%C3%A6%C3%B8')"),
+        ("abc('x x')", "abc('x%20x')"),
+        ("abc(stuff='æ',more='abc')", "abc(stuff='%C3%A6',more='abc')"),
+        ("abc(stuff='abc',more='æ')", "abc(stuff='abc',more='%C3%A6')"),
+        ("abc(stuff='a-b_c.1~/')", "abc(stuff='a-b_c.1~/')"),
+        ("abc(00000000-0000-0000-0000-000000000001)", "abc(00000000-0000-0000-0000-000000000001)"),
+        ("abc(code=1,name='')", "abc(code=1,name='')"),
+    ],
+)
+def test_altkeys_encode(url: str, expected: str):
+    assert encode_altkeys(url) == expected
+
+
+def test_altkeys_encode_matches_quote():
+    value = "".join(chr(i) for i in range(1, 0x250) if chr(i) != "'") + "€😀"
+    assert encode_altkeys(f"abc(key='{value}')") == f"abc(key='{quote(value)}')"
+
+    # Single characters, so the safe ones go through the unescaped fast path
+    for char in value:
+        assert encode_altkeys(f"abc(key='{char}')") == f"abc(key='{quote(char)}')"